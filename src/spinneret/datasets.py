@@ -1,5 +1,6 @@
 """Access built-in data objects"""
 import importlib.resources
+import os
 
 
 def get_example_eml_dir():
@@ -13,5 +14,5 @@ def get_example_eml_dir():
     --------
     >>> get_example_eml_dir()
     """
-    res = str(importlib.resources.files("spinneret.data")) + "/eml"
+    res = os.path.join(str(importlib.resources.files("spinneret.data")), "eml")
     return res
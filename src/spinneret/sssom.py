@@ -1,6 +1,8 @@
 """SSSOM related operations"""
+import os
 import pandas as pd
 from rdflib import Graph
+from rdflib.namespace import SKOS
 
 
 def from_lter(path_in, path_out):
@@ -43,16 +45,15 @@ def from_lter(path_in, path_out):
     >>> path_out = '/Users/me/Documents'
     >>> res = sssom.from_lter(path_in, path_out)
     """
-    data_path = path_out + "/" + "lter.sssom.tsv"
-    meta_path = path_out + "/" + "lter.sssom.yml"
+    data_path = os.path.join(path_out, "lter.sssom.tsv")
+    meta_path = os.path.join(path_out, "lter.sssom.yml")
     g = Graph()
     g.parse(path_in)
     data = []
-    for s, p, o in g:
-        if str(p) == "http://www.w3.org/2004/02/skos/core#prefLabel":
-            row = [str(s), str(o)]
-            row.extend([""] * 10)
-            data.append(row)
+    for s, o in g.subject_objects(SKOS.prefLabel):
+        row = [str(s), str(o)]
+        row.extend([""] * 10)
+        data.append(row)
     cols = [
         "subject_id",
         "subject_label",
@@ -4,6 +4,32 @@ from uuid import uuid4
 from lxml import etree
 import pandas as pd
 
+_ENTITIES = (
+    "dataTable",
+    "otherEntity",
+    "spatialVector",
+    "spatialRaster",
+    "storedProcedure",
+    "view",
+)
+
+_COLNAMES = [
+    "package_id",
+    "url",
+    "element",
+    "element_id",
+    "element_xpath",
+    "context",
+    "subject",
+    "predicate",
+    "predicate_id",
+    "object",
+    "object_id",
+    "author",
+    "date",
+    "comment",
+]
+
 
 def create(eml, elements, base_url, path_out=False):
     """Create an annotation workbook from EML files
@@ -83,7 +109,7 @@ def create(eml, elements, base_url, path_out=False):
     'path_out' argument.
     """
     if os.path.isdir(eml):
-        eml = [eml + "/" + p for p in os.listdir(eml)]
+        eml = [e.path for e in os.scandir(eml) if e.is_file()]
     else:
         eml = [eml]
     res = []
@@ -92,7 +118,7 @@ def create(eml, elements, base_url, path_out=False):
         res.append(df)
     res = pd.concat(res)
     if path_out:
-        path_out = path_out + "/" + "annotation_workbook.tsv"
+        path_out = os.path.join(path_out, "annotation_workbook.tsv")
         res.to_csv(path_out, sep="\t", index=False, mode="x")
     return res
 
@@ -141,23 +167,7 @@ def elements_to_df(eml, elements, base_url):
                 "",  # comment
             ]
             res.append(row)
-    colnames = [
-        "package_id",
-        "url",
-        "element",
-        "element_id",
-        "element_xpath",
-        "context",
-        "subject",
-        "predicate",
-        "predicate_id",
-        "object",
-        "object_id",
-        "author",
-        "date",
-        "comment",
-    ]
-    res = pd.DataFrame(res, columns=colnames)
+    res = pd.DataFrame(res, columns=_COLNAMES)
     return res
 
 
@@ -186,24 +196,17 @@ def get_subject_and_context(element):
     these fields is difficult since annotatable elements (specified by the EML
     schema) aren't constrained to leaf nodes with text values.
     """
-    entities = [
-        "dataTable",
-        "otherEntity",
-        "spatialVector",
-        "spatialRaster",
-        "storedProcedure",
-        "view",
-    ]
-    if element.tag in "dataset":
+    tag = element.tag
+    if tag == "dataset":
         subject = "dataset"
         p = element.getparent()
         context = p.xpath("./@packageId")[0]
-    elif element.tag in entities:
+    elif tag in _ENTITIES:
         subject = element.findtext(".//objectName")
         context = "dataset"
-    elif element.tag in "attribute":
+    elif tag == "attribute":
         subject = element.findtext(".//attributeName")
-        entity = list(element.iterancestors(entities))
-        context = entity[0].findtext(".//objectName")
+        entity = next(element.iterancestors(_ENTITIES))
+        context = entity.findtext(".//objectName")
     res = {"subject": subject, "context": context}
     return res